@@ -3,15 +3,34 @@
 
 from __future__ import absolute_import
 
-from .archive import ArchiveDiffer, GitArchiveDiffer, S3ArchiveDiffer
+import importlib
+
 from .export import create_export_csv
 from .utils import read_params
 
-from .slack_notifier import SlackNotifier
 from .logger import get_structured_logger
 from .geomap import GeoMapper
 from .smooth import Smoother
 from .signal import add_prefix
 from .nancodes import Nans
 
+# The archive and slack modules pull in heavy dependencies (boto3, git,
+# slack) that most indicator runs never touch, so import them lazily on
+# first attribute access instead of at package load.
+_LAZY_IMPORTS = {
+    "ArchiveDiffer": "archive",
+    "GitArchiveDiffer": "archive",
+    "S3ArchiveDiffer": "archive",
+    "SlackNotifier": "slack_notifier",
+}
+
+
+def __getattr__(name):
+    """Resolve the lazily imported names declared in _LAZY_IMPORTS."""
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module("." + _LAZY_IMPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __version__ = "0.1.10"
@@ -1,6 +1,7 @@
 """Utility functions for validation."""
+import re
 from dataclasses import dataclass, field
-from datetime import date, datetime, timedelta
+from datetime import date, timedelta
 from typing import List
 import pandas as pd
 
@@ -15,6 +16,10 @@ GEO_REGEX_DICT = {
     'nation': r'^[a-zA-Z]{2}$'
 }
 
+# Lag values of the form "sunday+m,n": upload weekday digit, then lag upon
+# upload.
+SUNDAY_LAG_REGEX = re.compile(r"sunday\+(\d),(\d+)$")
+
 
 @dataclass
 class TimeWindow:
@@ -28,8 +33,10 @@ class TimeWindow:
     def __post_init__(self):
         """Derive the start date of this span."""
         self.start_date = self.end_date - self.span_length + timedelta(days = 1)
-        self.date_seq = [self.start_date + timedelta(days=x)
-                         for x in range(self.span_length.days)]
+        # pd.date_range builds the vector in C, avoiding span_length.days
+        # date+timedelta operations in the interpreter.
+        self.date_seq = pd.date_range(
+            self.start_date, self.end_date, freq="D").date.tolist()
 
     @classmethod
     def from_params(cls, end_date_str: str, span_length_int: int):
@@ -46,7 +53,8 @@ class TimeWindow:
             days_back = (date.isoweekday() - int(end_date_str[7:])) % 7
             end_date = date.today() - timedelta(days=days_back)
         else:
-            end_date = datetime.strptime(end_date_str, '%Y-%m-%d').date()
+            # fromisoformat is much faster than strptime for fixed-format dates
+            end_date = date.fromisoformat(end_date_str)
         return cls(end_date, span_length)
 
 
@@ -70,16 +78,19 @@ def aggregate_frames(frames_list):
     """
     all_frames = []
     for _, match, data_df in frames_list:
-        df = data_df.copy()
+        # Parse the fixed-format YYYYMMDD date directly; strptime is far
+        # slower and this runs once per file.
+        date_str = match.groupdict()['date']
         # Get geo_type, date, and signal name as specified by CSV name.
-        df['geo_type'] = match.groupdict()['geo_type']
-        df['time_value'] = datetime.strptime(
-            match.groupdict()['date'], "%Y%m%d").date()
-        df['signal'] = match.groupdict()['signal']
-
-        all_frames.append(df)
+        # assign() leaves the input frame untouched, so no explicit copy
+        # (and its doubled peak memory) is needed.
+        all_frames.append(data_df.assign(
+            geo_type=match.groupdict()['geo_type'],
+            time_value=date(
+                int(date_str[0:4]), int(date_str[4:6]), int(date_str[6:8])),
+            signal=match.groupdict()['signal']))
 
-    return pd.concat(all_frames).reset_index(drop=True)
+    return pd.concat(all_frames, ignore_index=True)
 
 def lag_converter(lag_dict):
     """Convert a dictionary of lag values into the proper format.
@@ -100,27 +111,29 @@ def lag_converter(lag_dict):
             If not present then by the 'all' indicator,
             else 1.
     """
+    # Computed once rather than per signal
+    today_weekday = date.today().isoweekday()
+
     def value_interpret(value):
         """Convert value from string to numeric, including sunday+m,n."""
         if isinstance(value, int):
             value_num = value
         elif value.startswith("sunday+"):
+            sunday_match = SUNDAY_LAG_REGEX.match(value)
             # Check that the number proceeding sunday+ has length of 1
-            assert value[8] == ","
+            assert sunday_match
             # Value_num calculates the number of days between today and the
             # Update day, if both days of the week are the same,
             # Expected lag is 0
-            value_num = (date.today().isoweekday() - int(value[7:8])) % 7
+            value_num = (today_weekday - int(sunday_match.group(1))) % 7
             # Add on expected lag to lag from weekdays
-            value_num += int(value[9:])
+            value_num += int(sunday_match.group(2))
         else:
             value_num = int(value)
         return value_num
 
     # Converting strings to numeric output
-    output_dict = {sig:value_interpret(lag_dict.get(
-        sig)) for sig in lag_dict.keys()}
-    return output_dict
+    return {sig: value_interpret(value) for sig, value in lag_dict.items()}
 
 def end_date_helper(params):
     """Calculate end_date from params."""
@@ -9,7 +9,7 @@ import json
 import logging
 import os
 from typing import Tuple, List
-from multiprocessing import cpu_count, Pool
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
 import pandas as pd
@@ -31,9 +31,11 @@ class CovidNet:
             outfile: The output JSON file to write to
         """
         params = {"appVersion": "Public"}
-        data = requests.get(url, params).json()
+        resp = requests.get(url, params)
+        # Surface 4xx/5xx responses instead of caching an error page
+        resp.raise_for_status()
         with open(outfile, "w") as f_json:
-            json.dump(data, f_json)
+            json.dump(resp.json(), f_json)
 
     @staticmethod
     def read_mappings(infile: str) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
@@ -93,10 +95,12 @@ class CovidNet:
             "seasons": [{"ID": season_id} for season_id in seasons],
             "agegroups": [{"ID": ag_id} for ag_id in age_groups]
         }
-        data = requests.post(url, json=download_params).json()
+        resp = requests.post(url, json=download_params)
+        # Surface 4xx/5xx responses instead of caching an error page
+        resp.raise_for_status()
 
         with open(outfile, "w") as f_json:
-            json.dump(data, f_json)
+            json.dump(resp.json(), f_json)
 
     @staticmethod
     def download_all_hosp_data(
@@ -122,27 +126,30 @@ class CovidNet:
         # All age groups
         age_groups = list(age_info.loc[age_info["label"] == "Overall", "ageid"])
 
-        # Set up arguments for download, and file names for return
+        # Set up arguments for download, and file names for return.
+        # Index the cache with a single listdir rather than one stat call
+        # per state file.
+        cached_files = set(os.listdir(cache_path))
         state_files = []
         state_args = []
         for nid, cid in args.itertuples(index=False, name=None):
-            outfile = os.path.join(cache_path, f"networkid_{nid}_catchmentid_{cid}.json")
+            filename = f"networkid_{nid}_catchmentid_{cid}.json"
+            outfile = os.path.join(cache_path, filename)
             state_files.append(outfile)
-            if not os.path.exists(outfile):
+            if filename not in cached_files:
                 args = (nid, cid, age_groups, APIConfig.SEASONS, outfile, APIConfig.HOSP_URL)
                 state_args.append(args)
 
         # Download all state files
         if parallel:
-            # Originally used context-manager API, but does not work well with pytest-cov
-            # https://pytest-cov.readthedocs.io/en/latest/subprocess-support.html#if-you-use-multiprocessing-pool
-            # However seems to still produce .coverage.<HOSTNAME>... files on python 3.8 at least
-            pool = Pool(min(10, cpu_count()))
-            try:
-                pool.starmap(CovidNet.download_hosp_data, state_args)
-            finally:
-                pool.close()
-                pool.join()
+            # The downloads are network-bound, so threads overlap the HTTP
+            # round-trips without the process-spawn overhead (and pytest-cov
+            # subprocess issues) of multiprocessing.Pool
+            with ThreadPoolExecutor(max_workers=10) as pool:
+                futures = [pool.submit(CovidNet.download_hosp_data, *args)
+                           for args in state_args]
+                for future in futures:
+                    future.result()
         else:
             for args in state_args:
                 CovidNet.download_hosp_data(*args)
@@ -14,6 +14,9 @@ from .constants import DC_FIPS, METRICS, COMBINED_METRIC
 colname_map = {"symptom_" +
                metric.replace(" ", "_"): metric for metric in METRICS}
 
+# Compiled once; county geo_ids must be exactly five digits.
+FIPS_PATTERN = re.compile(r"\d{5}")
+
 
 def preprocess(df, level):
     """
@@ -42,8 +45,8 @@ def preprocess(df, level):
     KEEP_COLUMNS = ["geo_id", "date"] + METRICS + [COMBINED_METRIC]
 
     df.rename(colname_map, axis=1, inplace=True)
-    df["geo_id"] = df["open_covid_region_code"].apply(
-        lambda x: x.split("-")[-1].lower())
+    df["geo_id"] = df["open_covid_region_code"] \
+        .str.split("-").str[-1].str.lower()
 
     df[COMBINED_METRIC] = 0
     for metric in METRICS:
@@ -58,10 +61,7 @@ def preprocess(df, level):
 
     # Confirm FIPS
     if level == "county":
-        test_result = []
-        for fips in df["geo_id"].values:
-            test_result.append(len(re.findall(r"\b\d{5}\b", fips)) == 1)
-        assert all(test_result)
+        assert df["geo_id"].str.fullmatch(FIPS_PATTERN, na=False).all()
 
     # keep necessary columns only
     try:
@@ -6,6 +6,10 @@ from delphi_utils import GeoMapper
 VALID_GEO_RES = ("county", "state", "msa", "hrr", "hhs", "nation")
 INCIDENCE_BASE = 100000
 
+# Shared across geo_map calls so crosswalk files are loaded only once per
+# run instead of once per (geo, sensor) combination.
+gmpr = GeoMapper()
+
 
 def geo_map(df: pd.DataFrame, geo_res: str, sensor: str):
     """
@@ -31,7 +35,6 @@ def geo_map(df: pd.DataFrame, geo_res: str, sensor: str):
     df = df.copy()
     if geo_res not in VALID_GEO_RES:
         raise ValueError(f"geo_res must be one of {VALID_GEO_RES}")
-    gmpr = GeoMapper()
     df = add_county_pop(df, gmpr)
     unassigned_counties = df[df["fips"].str.endswith("000")].copy()
     df = df[~df["fips"].str.endswith("000")].copy()
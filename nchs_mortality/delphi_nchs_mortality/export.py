@@ -24,13 +24,15 @@ def export_csv(df, geo_name, sensor, export_dir, start_date):
     df = df.copy()
     df = df[df["timestamp"] >= start_date]
 
-    dates = df["timestamp"].unique()
+    # Parse the unique dates once as a vector rather than string-converting
+    # each one inside the loop.
+    dates = pd.to_datetime(df["timestamp"].unique())
     for date in dates:
-        t = Week.fromdate(pd.to_datetime(str(date)))
+        t = Week.fromdate(date)
         date_short = "weekly_" + str(t.year) + str(t.week).zfill(2)
         export_fn = f"{date_short}_{geo_name}_{sensor}.csv"
         result_df = df[df["timestamp"] == date][["geo_id", "val", "se", "sample_size"]]
         result_df.to_csv(f"{export_dir}/{export_fn}",
                          index=False,
                          float_format="%.8f")
-    return pd.to_datetime(dates)
+    return dates
@@ -52,13 +52,15 @@ def read_historical_data():
     pull_dir = "/common/quidel-historical-raw"
     columns = ['SofiaSerNum', 'TestDate', 'Facility', 'ZipCode',
                                'FluA', 'FluB', 'StorageDate']
-    df = pd.DataFrame(columns=columns)
 
+    # Accumulate the per-file frames and concatenate once; appending to a
+    # single frame recopies all previously read data for every file.
+    historical_dfs = [pd.DataFrame(columns=columns)]
     for fn in os.listdir(pull_dir):
         if "xlsx" in fn:
             newdf = pd.read_excel("/".join([pull_dir, fn]))
-            df = df.append(newdf[columns])
-    return df
+            historical_dfs.append(newdf[columns])
+    return pd.concat(historical_dfs, ignore_index=True)
 
 def regulate_column_names(df, test_type):
     """
@@ -103,7 +105,9 @@ def get_from_email(column_names, start_dates, end_dates, mail_server,
         df: pd.DataFrame
     """
     time_flag = None
-    dfs = {test: pd.DataFrame(columns=column_names[test]) \
+    # Collect the per-attachment frames and concatenate once per test type;
+    # repeated DataFrame.append recopies all accumulated rows each time.
+    new_dfs = {test: [pd.DataFrame(columns=column_names[test])] \
            for test in ["covid_ag", "flu_ag"]}
     start_date = compare_dates(start_dates["covid_ag"],
                                start_dates["flu_ag"], "s")
@@ -137,23 +141,19 @@ def get_from_email(column_names, start_dates, end_dates, mail_server,
                     toread.seek(0)  # reset the pointer
                     newdf = pd.read_excel(toread)  # now read to dataframe
                     newdf = regulate_column_names(newdf, test)
-                    dfs[test] = dfs[test].append(newdf)
+                    new_dfs[test].append(newdf)
                     time_flag = search_date
+    dfs = {test: pd.concat(frames, ignore_index=True)
+           for test, frames in new_dfs.items()}
     return dfs, time_flag
 
 def fix_zipcode(df):
     """Fix zipcode that is 9 digit instead of 5 digit."""
-    zipcode5 = []
-    fixnum = 0
-    for zipcode in df['Zip'].values:
-        if isinstance(zipcode, str) and '-' in zipcode:
-            zipcode5.append(int(zipcode.split('-')[0]))
-            fixnum += 1
-        else:
-            zipcode = int(float(zipcode))
-            zipcode5.append(zipcode)
-    df['zip'] = zipcode5
-    # print('Fixing %.2f %% of the data' % (fixnum * 100 / len(zipcode5)))
+    # 9-digit zipcodes arrive as "12345-6789"; keeping the part before the
+    # dash covers them, while the float cast handles numeric entries. The
+    # vectorized string ops stay in C instead of looping per row.
+    df['zip'] = df['Zip'].astype(str).str.split('-').str[0] \
+        .astype(float).astype(int)
     return df
 
 def fix_date(df):
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 """Collect and process Quidel export files."""
+from collections import defaultdict
 from os.path import join
 import os
 from datetime import datetime, timedelta
@@ -28,8 +29,11 @@ def get_from_s3(start_date, end_date, bucket):
                                'State', 'Zip', 'PatientAge', 'Result1',
                                'Result2', 'OverallResult', 'StorageDate',
                                'fname']
-    df = pd.DataFrame(columns=selected_columns)
-    s3_files = {}
+    # Accumulate the per-file frames and concatenate once; appending to a
+    # single frame recopies all previously read data for every file.
+    dfs = [pd.DataFrame(columns=selected_columns)]
+    seen_fnames = set()
+    s3_files = defaultdict(list)
     for obj in bucket.objects.all():
         if "-sars" in obj.key:
             date_string = obj.key.split("/")[1]
@@ -40,43 +44,35 @@ def get_from_s3(start_date, end_date, bucket):
                 received_date = datetime(yy, mm, dd)
             except ValueError:
                 continue
-            if received_date not in s3_files.keys():
-                s3_files[received_date] = [obj.key]
-            else:
-                s3_files[received_date].append(obj.key)
+            s3_files[received_date].append(obj.key)
 
     n_days = (end_date - start_date).days + 1
     for search_date in [start_date + timedelta(days=x) for x in range(n_days)]:
-        if search_date in s3_files.keys():
+        if search_date in s3_files:
             # Avoid appending duplicate datasets
             print("Pulling data received on %s"%search_date.date())
 
             # Fetch data received on the same day
             for fn in s3_files[search_date]:
-                if fn in set(df["fname"].values):
+                if fn in seen_fnames:
                     continue
+                seen_fnames.add(fn)
                 obj = bucket.Object(key=fn)
                 newdf = pd.read_csv(obj.get()["Body"],
                                     parse_dates=["StorageDate", "TestDate"],
                                     low_memory=False)
                 newdf["fname"] = fn
-                df = df.append(newdf[selected_columns])
+                dfs.append(newdf[selected_columns])
                 time_flag = search_date
-    return df, time_flag
+    return pd.concat(dfs, ignore_index=True), time_flag
 
 def fix_zipcode(df):
     """Fix zipcode that is 9 digit instead of 5 digit."""
-    zipcode5 = []
-    fixnum = 0
-    for zipcode in df['Zip'].values:
-        if isinstance(zipcode, str) and '-' in zipcode:
-            zipcode5.append(int(zipcode.split('-')[0]))
-            fixnum += 1
-        else:
-            zipcode = int(float(zipcode))
-            zipcode5.append(zipcode)
-    df['zip'] = zipcode5
-    # print('Fixing %.2f %% of the data' % (fixnum * 100 / len(zipcode5)))
+    # 9-digit zipcodes arrive as "12345-6789"; keeping the part before the
+    # dash covers them, while the float cast handles numeric entries. The
+    # vectorized string ops stay in C instead of looping per row.
+    df['zip'] = df['Zip'].astype(str).str.split('-').str[0] \
+        .astype(float).astype(int)
     return df
 
 def fix_date(df):
@@ -6,6 +6,10 @@ from delphi_utils import GeoMapper
 
 INCIDENCE_BASE = 100000
 
+# Shared across geo_map calls so crosswalk files are loaded only once per
+# run instead of once per (geo, sensor) combination.
+gmpr = GeoMapper()
+
 SECONDARY_FIPS = [
     ("51620", ["51093", "51175"]),
     ("51685", ["51153"]),
@@ -91,7 +95,6 @@ def geo_map(df: pd.DataFrame, geo_res: str, sensor: str):
     # Disburse unallocated cases/deaths in NYC to NYC counties
     df = disburse(df, NYC_FIPS[0][0], NYC_FIPS[0][1])
     df = df[df["fips"] != NYC_FIPS[0][0]]
-    gmpr = GeoMapper()
     # The FIPS code 00001 is a dummy for unallocated NYC data.  It doesn't have
     # a corresponding population entry in the GeoMapper so it will be dropped
     # in the call to `add_population_column()`.  We pull it out here to